@@ -1,11 +1,24 @@
 import argparse
 import asyncio
+import base64
+import itertools
+import json
+import math
+import multiprocessing
+import os
 import random
-import statistics
+import shutil
+import ssl
+import string
+import subprocess
 import sys
+import tempfile
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
 try:
     import aiohttp
@@ -13,11 +26,48 @@ except ImportError:
     print("error: aiohttp is required. install with: pip install aiohttp")
     sys.exit(1)
 
+# multidict ships with aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+if sys.version_info < (3, 11):
+    print("error: python 3.11+ is required (asyncio.TaskGroup)")
+    sys.exit(1)
+
+# uvloop is optional: a faster event loop for the asyncio engine
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# numpy is optional: it sorts the packed latency samples without boxing them
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is optional: it only speeds up encoding of the ingestion payloads
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 # default configuration
 DEFAULT_BASE_URL = "http://localhost:8080"
 DEFAULT_CONCURRENCY = 100
 DEFAULT_DURATION_SECONDS = 30
+DEFAULT_JITTER_MS = 0
+
+# random picks drawn per batch by each worker; kept small because every one
+# of potentially thousands of workers holds its own buffer
+RANDOM_BATCH_SIZE = 256
+
+# bytes of a failed response body kept in the error sample
+ERROR_BODY_PREVIEW_BYTES = 128
+
+# upper bound of the random delay before each worker's first request
+STARTUP_STAGGER_SECONDS = 0.05
 
 # event types with weights for realistic distribution
 EVENT_TYPES = [
@@ -29,14 +79,25 @@ EVENT_TYPES = [
     ("share", 5),
 ]
 
+# page sizes and offsets used by discovery workers
+DISCOVERY_LIMITS = (10, 20, 50)
+DISCOVERY_OFFSETS = (0, 0, 0, 10, 20)  # most requests are first page
+
+# cumulative weights are computed once so each draw is a single C-level call
+_EVENT_NAMES = [event_type for event_type, _ in EVENT_TYPES]
+_EVENT_CUM_WEIGHTS = list(itertools.accumulate(weight for _, weight in EVENT_TYPES))
+
 
 @dataclass
 class LatencyStats:
     """tracks latency metrics for a test scenario"""
-    latencies: list = field(default_factory=list)
+    # packed float32 samples: 4 bytes each instead of a boxed python float
+    latencies: array = field(default_factory=lambda: array("f"))
     successes: int = 0
     failures: int = 0
-    errors: list = field(default_factory=list)
+    errors: deque = field(default_factory=lambda: deque(maxlen=10))  # last 10 errors for debugging
+    # sorted copy of latencies, reused until new samples arrive
+    _sorted: Optional[Sequence[float]] = field(default=None, repr=False, compare=False)
     
     def record_success(self, latency_ms: float):
         self.latencies.append(latency_ms)
@@ -44,16 +105,38 @@ class LatencyStats:
     
     def record_failure(self, error: str):
         self.failures += 1
-        if len(self.errors) < 10:  # keep first 10 errors for debugging
-            self.errors.append(error)
+        self.errors.append(error)
+    
+    def sorted_latencies(self) -> Sequence[float]:
+        # latencies are append-only, so a length change means the cache is stale
+        if self._sorted is None or len(self._sorted) != len(self.latencies):
+            if np is not None:
+                self._sorted = np.sort(np.frombuffer(self.latencies, dtype=np.float32))
+            else:
+                self._sorted = array("f", sorted(self.latencies))
+        return self._sorted
+    
+    def mean_latency(self) -> float:
+        if np is not None:
+            # vectorised over the packed buffer, accumulated in float64
+            return float(np.frombuffer(self.latencies, dtype=np.float32).mean(dtype=np.float64))
+        return math.fsum(self.latencies) / len(self.latencies)
     
     def percentile(self, p: float) -> float:
         if not self.latencies:
             return 0.0
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * p / 100)
-        idx = min(idx, len(sorted_latencies) - 1)
-        return sorted_latencies[idx]
+        return _percentile(self.sorted_latencies(), p)
+    
+    @classmethod
+    def merge(cls, shards: list) -> "LatencyStats":
+        """combine per-worker shards into a single set of stats"""
+        merged = cls()
+        for shard in shards:
+            merged.latencies.extend(shard.latencies)
+            merged.successes += shard.successes
+            merged.failures += shard.failures
+            merged.errors.extend(shard.errors)
+        return merged
     
     def summary(self) -> dict:
         if not self.latencies:
@@ -64,33 +147,91 @@ class LatencyStats:
                 "error_rate": 100.0 if self.failures > 0 else 0.0,
             }
         
+        # every order statistic below reads from the one cached sort
+        ordered = self.sorted_latencies()
+        
         return {
             "total_requests": self.successes + self.failures,
             "successes": self.successes,
             "failures": self.failures,
             "error_rate": round(self.failures / (self.successes + self.failures) * 100, 2),
-            "min_ms": round(min(self.latencies), 2),
-            "max_ms": round(max(self.latencies), 2),
-            "mean_ms": round(statistics.mean(self.latencies), 2),
-            "median_ms": round(statistics.median(self.latencies), 2),
-            "p50_ms": round(self.percentile(50), 2),
-            "p90_ms": round(self.percentile(90), 2),
-            "p95_ms": round(self.percentile(95), 2),
-            "p99_ms": round(self.percentile(99), 2),
-            "requests_per_second": round(self.successes / (max(self.latencies) / 1000) if self.latencies else 0, 2),
+            "min_ms": round(float(ordered[0]), 2),
+            "max_ms": round(float(ordered[-1]), 2),
+            "mean_ms": round(self.mean_latency(), 2),
+            "median_ms": round(_median(ordered), 2),
+            "p50_ms": round(_percentile(ordered, 50), 2),
+            "p90_ms": round(_percentile(ordered, 90), 2),
+            "p95_ms": round(_percentile(ordered, 95), 2),
+            "p99_ms": round(_percentile(ordered, 99), 2),
+            "requests_per_second": round(self.successes / (float(ordered[-1]) / 1000), 2),
         }
 
 
+def _percentile(ordered: Sequence[float], p: float) -> float:
+    """nearest-rank percentile over an already sorted sequence"""
+    idx = int(len(ordered) * p / 100)
+    idx = min(idx, len(ordered) - 1)
+    return float(ordered[idx])
+
+
+def _median(ordered: Sequence[float]) -> float:
+    """median of an already sorted sequence, without statistics.median's re-sort"""
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return float(ordered[mid])
+    return (float(ordered[mid - 1]) + float(ordered[mid])) / 2
+
+
 def weighted_random_event() -> str:
     """select event type based on realistic distribution"""
-    total = sum(w for _, w in EVENT_TYPES)
-    r = random.randint(1, total)
-    cumulative = 0
-    for event_type, weight in EVENT_TYPES:
-        cumulative += weight
-        if r <= cumulative:
-            return event_type
-    return "view"
+    return random.choices(_EVENT_NAMES, cum_weights=_EVENT_CUM_WEIGHTS)[0]
+
+
+def create_session(concurrency: int, base_url: str) -> aiohttp.ClientSession:
+    """build the client session shared by all scenarios of a run"""
+    # one tls context for every connection; aiohttp only speaks http/1.1 so
+    # h2 is deliberately not advertised. tcp_nodelay is already set by aiohttp
+    ssl_context = None
+    if base_url.startswith("https://"):
+        ssl_context = ssl.create_default_context()
+        ssl_context.set_alpn_protocols(["http/1.1"])
+    
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        ssl=ssl_context or True,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def batched_draws(*columns: tuple, batch: int = RANDOM_BATCH_SIZE):
+    """yield tuples holding one random pick per column, drawn a batch at a time
+
+    each column is (population, cum_weights); cum_weights None means uniform.
+    """
+    if np is not None:
+        rng = np.random.default_rng()
+        prepared = [
+            (
+                np.asarray(population, dtype=object),
+                None if cum_weights is None else np.diff(cum_weights, prepend=0) / cum_weights[-1],
+            )
+            for population, cum_weights in columns
+        ]
+        while True:
+            yield from zip(*(
+                population[rng.choice(len(population), size=batch, p=p)].tolist()
+                for population, p in prepared
+            ))
+    
+    rng = random.Random()
+    while True:
+        yield from zip(*(
+            rng.choices(population, cum_weights=cum_weights, k=batch)
+            for population, cum_weights in columns
+        ))
 
 
 async def fetch_communities(
@@ -121,44 +262,81 @@ async def ingestion_worker(
     community_ids: list,
     stats: LatencyStats,
     stop_event: asyncio.Event,
+    jitter_ms: int = 0,
+    arrivals: Optional[asyncio.Queue] = None,
 ):
     """worker that continuously sends POST /events requests"""
     url = f"{base_url}/api/v1/events"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
+    # immutable and reused by every request this worker sends
+    headers = CIMultiDictProxy(CIMultiDict((
+        ("Authorization", f"Bearer {token}"),
+        ("Content-Type", "application/json"),
+    )))
+    
+    # the payload shape is fixed per worker; only the target and type change
+    payload = {
+        "community_id": None,
+        "event_type": None,
+        "metadata": {
+            "worker_id": worker_id,
+            "source": "load_test",
+        },
     }
     
+    # bind hot-loop lookups and per-request constants once per worker
+    perf = time.perf_counter
+    next_draw = batched_draws((community_ids, None), (_EVENT_NAMES, _EVENT_CUM_WEIGHTS)).__next__
+    uniform = random.uniform
+    sleep = asyncio.sleep
+    post = session.post
+    record_ok = stats.record_success
+    record_fail = stats.record_failure
+    timeout = aiohttp.ClientTimeout(total=10)
+    jitter = jitter_ms / 1000
+    
+    # stagger start-up once to avoid a thundering herd on the first requests;
+    # in open-model runs the arrival schedule already spreads the load
+    if arrivals is None:
+        await sleep(uniform(0, STARTUP_STAGGER_SECONDS))
+    
     while not stop_event.is_set():
-        community_id = random.choice(community_ids)
-        event_type = weighted_random_event()
+        scheduled = None
+        if arrivals is not None:
+            scheduled = await arrivals.get()
+            if scheduled is None:
+                break
         
-        payload = {
-            "community_id": community_id,
-            "event_type": event_type,
-            "metadata": {
-                "worker_id": worker_id,
-                "source": "load_test",
-            },
-        }
+        payload["community_id"], payload["event_type"] = next_draw()
+        data = json_dumps(payload)
         
-        start = time.perf_counter()
+        # open model: latency counts from the scheduled arrival, so time spent
+        # queued behind a slow server is measured (no coordinated omission)
+        start = perf() if scheduled is None else scheduled
         try:
-            async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                latency_ms = (time.perf_counter() - start) * 1000
+            resp = await post(url, data=data, headers=headers, timeout=timeout)
+            try:
+                latency_ms = (perf() - start) * 1000
                 
                 if resp.status in (200, 201, 202):
-                    stats.record_success(latency_ms)
+                    record_ok(latency_ms)
                 else:
-                    body = await resp.text()
-                    stats.record_failure(f"status={resp.status}: {body[:100]}")
+                    # only a short prefix is kept, so never read a large error page in full
+                    body = await resp.content.read(ERROR_BODY_PREVIEW_BYTES)
+                    record_fail(f"status={resp.status}: {body.decode('utf-8', 'replace')}")
+            finally:
+                # the success body is never read. release() only returns the
+                # connection to the keep-alive pool when the payload is already
+                # at eof (e.g. an empty 2xx such as a bare 202); otherwise
+                # aiohttp closes it, exactly as the old async with did
+                resp.release()
         except asyncio.TimeoutError:
-            stats.record_failure("timeout")
+            record_fail("timeout")
         except Exception as e:
-            stats.record_failure(str(e)[:100])
+            record_fail(str(e)[:100])
         
-        # small jitter to avoid thundering herd
-        await asyncio.sleep(random.uniform(0.001, 0.01))
+        # optional pause between requests (--jitter-ms)
+        if jitter:
+            await sleep(uniform(0, jitter))
 
 
 async def discovery_worker(
@@ -168,149 +346,633 @@ async def discovery_worker(
     token: str,
     stats: LatencyStats,
     stop_event: asyncio.Event,
+    jitter_ms: int = 0,
+    arrivals: Optional[asyncio.Queue] = None,
 ):
     """worker that continuously sends GET /communities requests"""
     url = f"{base_url}/api/v1/communities"
-    headers = {"Authorization": f"Bearer {token}"}
+    # immutable and reused by every request this worker sends
+    headers = CIMultiDictProxy(CIMultiDict((("Authorization", f"Bearer {token}"),)))
+    
+    # bind hot-loop lookups and per-request constants once per worker
+    perf = time.perf_counter
+    next_draw = batched_draws((DISCOVERY_LIMITS, None), (DISCOVERY_OFFSETS, None)).__next__
+    uniform = random.uniform
+    sleep = asyncio.sleep
+    get = session.get
+    record_ok = stats.record_success
+    record_fail = stats.record_failure
+    timeout = aiohttp.ClientTimeout(total=10)
+    jitter = jitter_ms / 1000
+    
+    # stagger start-up once to avoid a thundering herd on the first requests;
+    # in open-model runs the arrival schedule already spreads the load
+    if arrivals is None:
+        await sleep(uniform(0, STARTUP_STAGGER_SECONDS))
     
     while not stop_event.is_set():
-        # vary the limit to simulate different client behaviors
-        limit = random.choice([10, 20, 50])
-        offset = random.choice([0, 0, 0, 10, 20])  # most requests are first page
+        scheduled = None
+        if arrivals is not None:
+            scheduled = await arrivals.get()
+            if scheduled is None:
+                break
         
+        # vary the limit to simulate different client behaviors
+        limit, offset = next_draw()
         params = {"limit": limit, "offset": offset}
         
-        start = time.perf_counter()
+        # open model: latency counts from the scheduled arrival, so time spent
+        # queued behind a slow server is measured (no coordinated omission)
+        start = perf() if scheduled is None else scheduled
         try:
-            async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                latency_ms = (time.perf_counter() - start) * 1000
+            resp = await get(url, headers=headers, params=params, timeout=timeout)
+            try:
+                latency_ms = (perf() - start) * 1000
                 
                 if resp.status == 200:
-                    stats.record_success(latency_ms)
+                    record_ok(latency_ms)
                 else:
-                    body = await resp.text()
-                    stats.record_failure(f"status={resp.status}: {body[:100]}")
+                    # only a short prefix is kept, so never read a large error page in full
+                    body = await resp.content.read(ERROR_BODY_PREVIEW_BYTES)
+                    record_fail(f"status={resp.status}: {body.decode('utf-8', 'replace')}")
+            finally:
+                # the success body is never read. release() only returns the
+                # connection to the keep-alive pool when the payload is already
+                # at eof (e.g. an empty 2xx such as a bare 202); otherwise
+                # aiohttp closes it, exactly as the old async with did
+                resp.release()
         except asyncio.TimeoutError:
-            stats.record_failure("timeout")
+            record_fail("timeout")
         except Exception as e:
-            stats.record_failure(str(e)[:100])
+            record_fail(str(e)[:100])
+        
+        # optional pause between requests (--jitter-ms)
+        if jitter:
+            await sleep(uniform(0, jitter))
+
+
+async def produce_arrivals(
+    arrivals: asyncio.Queue,
+    rps: float,
+    stop_event: asyncio.Event,
+    consumers: int,
+    stats: LatencyStats,
+):
+    """open-model load: enqueue poisson-distributed arrival times until stop_event is set"""
+    perf = time.perf_counter
+    rng = random.Random()
+    scheduled = perf()
+    
+    # the schedule is absolute, so a late wake-up enqueues every missed
+    # arrival at once instead of silently lowering the offered rate
+    while not stop_event.is_set():
+        scheduled += rng.expovariate(rps)
+        if scheduled <= perf():
+            # behind schedule: still yield, so workers and the deadline
+            # callback run even when the loop cannot sustain the rate
+            await asyncio.sleep(0)
         
-        # small jitter
-        await asyncio.sleep(random.uniform(0.001, 0.01))
+        # the event loop clock (notably uvloop's) can wake slightly before
+        # perf_counter reaches the target, and an early arrival would give a
+        # fast reply a negative latency, so keep waiting until it is due. the
+        # deadline cuts the wait short, so a long gap at low rates cannot run
+        # the scenario past --duration
+        while (delay := scheduled - perf()) > 0 and not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        if stop_event.is_set():
+            break
+        try:
+            arrivals.put_nowait(scheduled)
+        except asyncio.QueueFull:
+            stats.record_failure("dropped: arrival queue full")
+    
+    # arrivals never sent before the deadline count as dropped too
+    while not arrivals.empty():
+        arrivals.get_nowait()
+        stats.record_failure("dropped: not sent before deadline")
+    for _ in range(consumers):
+        arrivals.put_nowait(None)
+
+
+async def report_progress(stats_shards: list, stop_event: asyncio.Event, duration: int):
+    """print a progress line every second until stop_event is set"""
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    while not stop_event.is_set():
+        elapsed = int(loop.time() - start_time)
+        failures = sum(shard.failures for shard in stats_shards)
+        requests = sum(shard.successes for shard in stats_shards) + failures
+        print(f"\r  progress: {elapsed}/{duration}s | requests: {requests} | errors: {failures}", end="", flush=True)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+    
+    print()
 
 
 async def run_ingestion_test(
+    session: aiohttp.ClientSession,
     base_url: str,
     token: str,
     concurrency: int,
     duration: int,
     community_ids: list,
+    jitter_ms: int = 0,
+    rps: float = 0,
+    quiet: bool = False,
+    progress_shards: Optional[list] = None,
 ) -> LatencyStats:
     """run scenario A: ingestion load test"""
-    print(f"\n{'='*60}")
-    print("SCENARIO A: INGESTION LOAD TEST")
-    print(f"{'='*60}")
-    print(f"concurrency: {concurrency} workers")
-    print(f"duration: {duration} seconds")
-    print(f"target communities: {len(community_ids)}")
-    print(f"endpoint: POST /api/v1/events")
-    print()
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("SCENARIO A: INGESTION LOAD TEST")
+        print(f"{'='*60}")
+        print(f"concurrency: {concurrency} workers")
+        print(f"duration: {duration} seconds")
+        print(f"target communities: {len(community_ids)}")
+        print(f"endpoint: POST /api/v1/events")
+        if rps:
+            print(f"target rate: {rps:g} req/s (open model)")
+        print()
     
-    stats = LatencyStats()
+    # one shard per worker, merged once the run is over
+    stats_shards = [LatencyStats() for _ in range(concurrency)]
     stop_event = asyncio.Event()
     
-    connector = aiohttp.TCPConnector(limit=concurrency + 50, limit_per_host=concurrency + 50)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        # start all workers
-        workers = [
-            asyncio.create_task(
-                ingestion_worker(i, session, base_url, token, community_ids, stats, stop_event)
+    # open model: workers consume scheduled arrivals instead of looping freely;
+    # the queue holds ~2s of backlog and always has room for the stop sentinels
+    arrivals = None
+    if rps:
+        arrivals = asyncio.Queue(maxsize=max(int(2 * rps), concurrency))
+        stats_shards.append(LatencyStats())
+    
+    if progress_shards is not None:
+        # the caller prints one progress line for several concurrent scenarios
+        progress_shards.extend(stats_shards)
+    
+    # the loop sets stop_event at the deadline; workers then exit on their
+    # own and the group waits for in-flight requests instead of cancelling them
+    asyncio.get_running_loop().call_later(duration, stop_event.set)
+    async with asyncio.TaskGroup() as tg:
+        for i in range(concurrency):
+            tg.create_task(
+                ingestion_worker(
+                    i, session, base_url, token, community_ids, stats_shards[i], stop_event, jitter_ms, arrivals
+                )
             )
-            for i in range(concurrency)
-        ]
-        
-        # progress reporting
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            elapsed = int(time.time() - start_time)
-            print(f"\r  progress: {elapsed}/{duration}s | requests: {stats.successes + stats.failures} | errors: {stats.failures}", end="", flush=True)
-            await asyncio.sleep(1)
-        
-        print()
-        
-        # signal workers to stop
-        stop_event.set()
-        
-        # give workers a moment to finish
-        await asyncio.sleep(0.5)
-        
-        # cancel remaining tasks
-        for worker in workers:
-            worker.cancel()
-        
-        # wait for cancellation
-        await asyncio.gather(*workers, return_exceptions=True)
+        if arrivals is not None:
+            tg.create_task(produce_arrivals(arrivals, rps, stop_event, concurrency, stats_shards[-1]))
+        if not quiet and progress_shards is None:
+            tg.create_task(report_progress(stats_shards, stop_event, duration))
     
-    return stats
+    return LatencyStats.merge(stats_shards)
 
 
 async def run_discovery_test(
+    session: aiohttp.ClientSession,
     base_url: str,
     token: str,
     concurrency: int,
     duration: int,
+    jitter_ms: int = 0,
+    rps: float = 0,
+    quiet: bool = False,
+    progress_shards: Optional[list] = None,
 ) -> LatencyStats:
     """run scenario B: discovery load test"""
-    print(f"\n{'='*60}")
-    print("SCENARIO B: DISCOVERY LOAD TEST")
-    print(f"{'='*60}")
-    print(f"concurrency: {concurrency} workers")
-    print(f"duration: {duration} seconds")
-    print(f"endpoint: GET /api/v1/communities")
-    print()
+    if not quiet:
+        print(f"\n{'='*60}")
+        print("SCENARIO B: DISCOVERY LOAD TEST")
+        print(f"{'='*60}")
+        print(f"concurrency: {concurrency} workers")
+        print(f"duration: {duration} seconds")
+        print(f"endpoint: GET /api/v1/communities")
+        if rps:
+            print(f"target rate: {rps:g} req/s (open model)")
+        print()
     
-    stats = LatencyStats()
+    # one shard per worker, merged once the run is over
+    stats_shards = [LatencyStats() for _ in range(concurrency)]
     stop_event = asyncio.Event()
     
-    connector = aiohttp.TCPConnector(limit=concurrency + 50, limit_per_host=concurrency + 50)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        # start all workers
-        workers = [
-            asyncio.create_task(
-                discovery_worker(i, session, base_url, token, stats, stop_event)
+    # open model: workers consume scheduled arrivals instead of looping freely;
+    # the queue holds ~2s of backlog and always has room for the stop sentinels
+    arrivals = None
+    if rps:
+        arrivals = asyncio.Queue(maxsize=max(int(2 * rps), concurrency))
+        stats_shards.append(LatencyStats())
+    
+    if progress_shards is not None:
+        # the caller prints one progress line for several concurrent scenarios
+        progress_shards.extend(stats_shards)
+    
+    # the loop sets stop_event at the deadline; workers then exit on their
+    # own and the group waits for in-flight requests instead of cancelling them
+    asyncio.get_running_loop().call_later(duration, stop_event.set)
+    async with asyncio.TaskGroup() as tg:
+        for i in range(concurrency):
+            tg.create_task(
+                discovery_worker(i, session, base_url, token, stats_shards[i], stop_event, jitter_ms, arrivals)
             )
-            for i in range(concurrency)
-        ]
-        
-        # progress reporting
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            elapsed = int(time.time() - start_time)
-            print(f"\r  progress: {elapsed}/{duration}s | requests: {stats.successes + stats.failures} | errors: {stats.failures}", end="", flush=True)
-            await asyncio.sleep(1)
-        
-        print()
-        
-        # signal workers to stop
-        stop_event.set()
-        
-        # give workers a moment to finish
-        await asyncio.sleep(0.5)
-        
-        # cancel remaining tasks
-        for worker in workers:
-            worker.cancel()
+        if arrivals is not None:
+            tg.create_task(produce_arrivals(arrivals, rps, stop_event, concurrency, stats_shards[-1]))
+        if not quiet and progress_shards is None:
+            tg.create_task(report_progress(stats_shards, stop_event, duration))
+    
+    return LatencyStats.merge(stats_shards)
+
+
+def _run_scenario_process(
+    scenario: str,
+    base_url: str,
+    token: str,
+    concurrency: int,
+    duration: int,
+    community_ids: list,
+    jitter_ms: int,
+    rps: float,
+) -> LatencyStats:
+    """child process entry point: run one share of a scenario's workers"""
+    async def run() -> LatencyStats:
+        async with create_session(concurrency, base_url) as session:
+            if scenario == "ingestion":
+                return await run_ingestion_test(
+                    session, base_url, token, concurrency, duration, community_ids, jitter_ms, rps, quiet=True
+                )
+            return await run_discovery_test(
+                session, base_url, token, concurrency, duration, jitter_ms, rps, quiet=True
+            )
+    
+    return run_event_loop(run())
+
+
+async def run_in_processes(
+    scenario: str,
+    base_url: str,
+    token: str,
+    concurrency: int,
+    duration: int,
+    community_ids: list,
+    jitter_ms: int,
+    rps: float,
+    processes: int,
+) -> LatencyStats:
+    """split a scenario's workers (and target rate) across processes and merge their stats"""
+    shares = [concurrency // processes + (i < concurrency % processes) for i in range(processes)]
+    shares = [share for share in shares if share]
+    print(f"\n  running {scenario}: {concurrency} workers across {len(shares)} processes for {duration}s...")
+    
+    loop = asyncio.get_running_loop()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shares), mp_context=context) as pool:
+        shards = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _run_scenario_process,
+                scenario, base_url, token, share, duration, community_ids, jitter_ms, rps * share / concurrency,
+            )
+            for share in shares
+        ))
+    
+    return LatencyStats.merge(shards)
+
+
+# wrk lua script: request() mirrors the asyncio workers and done() prints a
+# single machine-readable result line instead of wrk's human-readable report
+WRK_SCRIPT = string.Template("""\
+-- generated by load_test.py
+local community_ids = {$community_ids}
+local event_names = {$event_names}
+local event_cum_weights = {$event_cum_weights}
+local limits = {$limits}
+local offsets = {$offsets}
+local headers = {
+  ["Authorization"] = $authorization,
+  ["Content-Type"] = "application/json",
+}
+local scenario = $scenario
+local threads_started = 0
+
+function setup(thread)
+  threads_started = threads_started + 1
+  thread:set("thread_id", threads_started)
+end
+
+function init(args)
+  math.randomseed(os.time() * 1000 + thread_id)
+end
+
+local function weighted_event()
+  local r = math.random() * event_cum_weights[#event_cum_weights]
+  for i = 1, #event_cum_weights do
+    if r < event_cum_weights[i] then
+      return event_names[i]
+    end
+  end
+  return event_names[#event_names]
+end
+
+function request()
+  if scenario == "discovery" then
+    local path = string.format(
+      "/api/v1/communities?limit=%d&offset=%d",
+      limits[math.random(#limits)], offsets[math.random(#offsets)]
+    )
+    return wrk.format("GET", path, headers)
+  end
+  local body = string.format(
+    '{"community_id":"%s","event_type":"%s","metadata":{"worker_id":%d,"source":"load_test"}}',
+    community_ids[math.random(#community_ids)], weighted_event(), thread_id
+  )
+  return wrk.format("POST", "/api/v1/events", headers, body)
+end
+
+function done(summary, latency, requests)
+  local e = summary.errors
+  io.write(string.format(
+    'PULSE_RESULT {"requests":%d,"status":%d,"connect":%d,"read":%d,"write":%d,"timeout":%d,' ..
+    '"min":%d,"max":%d,"mean":%f,"p50":%d,"p90":%d,"p95":%d,"p99":%d}\\n',
+    summary.requests, e.status, e.connect, e.read, e.write, e.timeout,
+    latency.min, latency.max, latency.mean,
+    latency:percentile(50), latency:percentile(90), latency:percentile(95), latency:percentile(99)
+  ))
+end
+""")
+
+# number of pre-drawn request bodies vegeta cycles through
+VEGETA_TARGETS = 1000
+
+
+def _lua_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _lua_list(values) -> str:
+    return ", ".join(_lua_string(v) if isinstance(v, str) else str(v) for v in values)
+
+
+def external_summary(requests: int, failures: int, latencies_ms: dict) -> dict:
+    """build a summary dict matching LatencyStats.summary() from engine output"""
+    summary = {
+        "total_requests": requests,
+        "successes": requests - failures,
+        "failures": failures,
+        "error_rate": round(failures / requests * 100, 2) if requests else 0.0,
+    }
+    if requests > failures:
+        summary.update({
+            f"{name}_ms": round(value, 2) for name, value in latencies_ms.items()
+        })
+        summary["median_ms"] = summary["p50_ms"]
+    return summary
+
+
+def require_binary(name: str) -> str:
+    path = shutil.which(name)
+    if path is None:
+        print(f"error: {name} is required for --engine {name}. install it and make sure it is on PATH")
+        sys.exit(1)
+    return path
+
+
+def run_wrk_test(
+    scenario: str,
+    base_url: str,
+    token: str,
+    concurrency: int,
+    duration: int,
+    community_ids: list,
+) -> tuple:
+    """run a scenario with wrk, returning (summary, errors)"""
+    wrk = require_binary("wrk")
+    threads = max(1, min(os.cpu_count() or 1, concurrency))
+    script = WRK_SCRIPT.substitute(
+        scenario=_lua_string(scenario),
+        community_ids=_lua_list(community_ids or []),
+        event_names=_lua_list(_EVENT_NAMES),
+        event_cum_weights=_lua_list(_EVENT_CUM_WEIGHTS),
+        limits=_lua_list(DISCOVERY_LIMITS),
+        offsets=_lua_list(DISCOVERY_OFFSETS),
+        authorization=_lua_string(f"Bearer {token}"),
+    )
+    
+    # single write: scenarios may start concurrently from worker threads
+    print(f"  running wrk ({scenario}): {threads} threads, {concurrency} connections, {duration}s\n", end="")
+    with tempfile.TemporaryDirectory() as tmp:
+        script_path = os.path.join(tmp, "pulse.lua")
+        with open(script_path, "w") as f:
+            f.write(script)
+        result = subprocess.run(
+            [wrk, f"-t{threads}", f"-c{concurrency}", f"-d{duration}s", "--timeout", "10s", "-s", script_path, base_url],
+            capture_output=True,
+            text=True,
+        )
+    
+    line = next((l for l in result.stdout.splitlines() if l.startswith("PULSE_RESULT ")), None)
+    if result.returncode != 0 or line is None:
+        print(f"error: wrk failed (exit {result.returncode}): {result.stderr.strip()[:200]}")
+        sys.exit(1)
+    
+    data = json.loads(line.split(" ", 1)[1])
+    # connect/read/write errors never reach summary.requests, but timeouts overlap it
+    # (a slow request still completes, and a stuck connection is re-counted every
+    # check), so they are reported on their own line and not added to the totals
+    socket_errors = data["connect"] + data["read"] + data["write"]
+    errors = []
+    if data["status"]:
+        errors.append(f"non-2xx/3xx responses: {data['status']}")
+    if socket_errors:
+        errors.append(
+            f"socket errors: connect {data['connect']}, read {data['read']}, write {data['write']}"
+        )
+    if data["timeout"]:
+        errors.append(f"timeouts: {data['timeout']}")
+    
+    # wrk reports latencies in microseconds
+    summary = external_summary(
+        data["requests"] + socket_errors,
+        data["status"] + socket_errors,
+        {name: data[name] / 1000 for name in ("min", "max", "mean", "p50", "p90", "p95", "p99")},
+    )
+    return summary, errors
+
+
+def vegeta_targets(scenario: str, base_url: str, token: str, community_ids: list) -> list:
+    """pre-draw request targets in vegeta's json format"""
+    targets = []
+    if scenario == "discovery":
+        header = {"Authorization": [f"Bearer {token}"]}
+        for _ in range(VEGETA_TARGETS):
+            limit = random.choice(DISCOVERY_LIMITS)
+            offset = random.choice(DISCOVERY_OFFSETS)
+            targets.append({
+                "method": "GET",
+                "url": f"{base_url}/api/v1/communities?limit={limit}&offset={offset}",
+                "header": header,
+            })
+        return targets
+    
+    header = {"Authorization": [f"Bearer {token}"], "Content-Type": ["application/json"]}
+    for i in range(VEGETA_TARGETS):
+        body = json_dumps({
+            "community_id": random.choice(community_ids),
+            "event_type": weighted_random_event(),
+            "metadata": {"worker_id": i, "source": "load_test"},
+        })
+        targets.append({
+            "method": "POST",
+            "url": f"{base_url}/api/v1/events",
+            "header": header,
+            "body": base64.b64encode(body).decode(),
+        })
+    return targets
+
+
+def run_vegeta_test(
+    scenario: str,
+    base_url: str,
+    token: str,
+    concurrency: int,
+    duration: int,
+    community_ids: list,
+    rps: float = 0,
+) -> tuple:
+    """run a scenario with vegeta, returning (summary, errors)"""
+    vegeta = require_binary("vegeta")
+    targets = vegeta_targets(scenario, base_url, token, community_ids)
+    
+    # single write: scenarios may start concurrently from worker threads
+    rate = f"{rps:g}/1s" if rps else "0"
+    print(f"  running vegeta ({scenario}): {concurrency} workers, rate {rate}, {duration}s\n", end="")
+    with tempfile.TemporaryDirectory() as tmp:
+        targets_path = os.path.join(tmp, "targets.json")
+        with open(targets_path, "wb") as f:
+            f.writelines(json_dumps(target) + b"\n" for target in targets)
         
-        # wait for cancellation
-        await asyncio.gather(*workers, return_exceptions=True)
+        # rate=0 sends as fast as the fixed worker pool allows; a positive
+        # rate is vegeta's native open model
+        attack = subprocess.Popen(
+            [
+                vegeta, "attack", "-format=json", f"-targets={targets_path}",
+                f"-rate={rate}", f"-workers={concurrency}", f"-max-workers={concurrency}",
+                f"-duration={duration}s", "-timeout=10s",
+            ],
+            stdout=subprocess.PIPE,
+        )
+        report = subprocess.run(
+            [vegeta, "report", "-type=json"],
+            stdin=attack.stdout,
+            capture_output=True,
+            text=True,
+        )
+        attack.stdout.close()
+        attack.wait()
+    
+    if attack.returncode != 0 or report.returncode != 0:
+        print(f"error: vegeta failed: {report.stderr.strip()[:200]}")
+        sys.exit(1)
     
-    return stats
+    # vegeta reports latencies in nanoseconds and success as a ratio
+    data = json.loads(report.stdout)
+    requests = data["requests"]
+    failures = requests - round(requests * data["success"])
+    latencies = data["latencies"]
+    summary = external_summary(
+        requests,
+        failures,
+        {
+            "min": latencies["min"] / 1e6,
+            "max": latencies["max"] / 1e6,
+            "mean": latencies["mean"] / 1e6,
+            "p50": latencies["50th"] / 1e6,
+            "p90": latencies["90th"] / 1e6,
+            "p95": latencies["95th"] / 1e6,
+            "p99": latencies["99th"] / 1e6,
+        },
+    )
+    return summary, (data.get("errors") or [])[:10]
 
 
-def print_results(scenario: str, stats: LatencyStats, duration: int):
-    """print formatted test results"""
-    summary = stats.summary()
+async def run_scenario(
+    session: aiohttp.ClientSession,
+    args: argparse.Namespace,
+    scenario: str,
+    concurrency: int,
+    duration: int,
+    community_ids: list,
+    rps: float = 0,
+    progress_shards: Optional[list] = None,
+    processes: Optional[int] = None,
+) -> tuple:
+    """run one scenario on the selected engine, returning (summary, errors)"""
+    if args.engine == "wrk":
+        return await asyncio.to_thread(
+            run_wrk_test, scenario, args.url, args.token, concurrency, duration, community_ids
+        )
+    if args.engine == "vegeta":
+        return await asyncio.to_thread(
+            run_vegeta_test, scenario, args.url, args.token, concurrency, duration, community_ids, rps
+        )
     
+    if args.processes > 1:
+        stats = await run_in_processes(
+            scenario, args.url, args.token, concurrency, duration, community_ids, args.jitter_ms, rps,
+            processes or args.processes,
+        )
+    elif scenario == "ingestion":
+        stats = await run_ingestion_test(
+            session, args.url, args.token, concurrency, duration, community_ids, args.jitter_ms, rps,
+            progress_shards=progress_shards,
+        )
+    else:
+        stats = await run_discovery_test(
+            session, args.url, args.token, concurrency, duration, args.jitter_ms, rps,
+            progress_shards=progress_shards,
+        )
+    return stats.summary(), list(stats.errors)
+
+
+async def run_mixed(
+    session: aiohttp.ClientSession,
+    args: argparse.Namespace,
+    community_ids: list,
+) -> tuple:
+    """run ingestion and discovery at the same time, half the workers (rate and processes) each"""
+    ingestion_concurrency = max(1, args.concurrency // 2)
+    discovery_concurrency = max(1, args.concurrency - ingestion_concurrency)
+    rps = args.rps / 2
+    # -p caps the total child processes, not the count per scenario
+    ingestion_processes = max(1, args.processes // 2)
+    discovery_processes = max(1, args.processes - ingestion_processes)
+    
+    # both scenarios share one progress line when the workers run in this process
+    progress_shards = None
+    progress = []
+    if args.engine == "asyncio" and args.processes == 1:
+        progress_shards = []
+        stop_event = asyncio.Event()
+        asyncio.get_running_loop().call_later(args.duration, stop_event.set)
+        progress.append(report_progress(progress_shards, stop_event, args.duration))
+    
+    ingestion, discovery, *_ = await asyncio.gather(
+        run_scenario(
+            session, args, "ingestion", ingestion_concurrency, args.duration, community_ids, rps, progress_shards,
+            ingestion_processes,
+        ),
+        run_scenario(
+            session, args, "discovery", discovery_concurrency, args.duration, community_ids, rps, progress_shards,
+            discovery_processes,
+        ),
+        *progress,
+    )
+    return ingestion, discovery
+
+
+def print_results(scenario: str, summary: dict, duration: int, errors: list):
+    """print formatted test results"""
     print(f"\n{'─'*60}")
     print(f"RESULTS: {scenario.upper()}")
     print(f"{'─'*60}")
@@ -320,7 +982,7 @@ def print_results(scenario: str, stats: LatencyStats, duration: int):
     print(f"  Failed:             {summary['failures']:,}")
     print(f"  Error Rate:         {summary['error_rate']}%")
     
-    if stats.latencies:
+    if "p50_ms" in summary:
         actual_rps = summary['successes'] / duration
         print(f"\n  Throughput:         {actual_rps:,.1f} req/s")
         
@@ -333,9 +995,9 @@ def print_results(scenario: str, stats: LatencyStats, duration: int):
         print(f"    p99:              {summary['p99_ms']}")
         print(f"    Max:              {summary['max_ms']}")
     
-    if stats.errors:
-        print(f"\n  Sample Errors ({len(stats.errors)}):")
-        for err in stats.errors[:5]:
+    if errors:
+        print(f"\n  Sample Errors ({len(errors)}):")
+        for err in errors[:5]:
             print(f"    - {err}")
     
     print()
@@ -353,8 +1015,14 @@ examples:
   # test discovery with 5000 concurrent users
   python load_test.py -s discovery -c 5000 -d 30 -t <jwt_token>
   
-  # test both scenarios
+  # test both scenarios as mixed traffic (500 workers each, concurrently)
   python load_test.py -s both -c 1000 -d 60 -t <jwt_token>
+  
+  # open-model run: 2000 req/s poisson arrivals, up to 500 requests in flight
+  python load_test.py -s ingestion -r 2000 -c 500 -d 30 -t <jwt_token>
+  
+  # drive ingestion with wrk for higher per-core throughput
+  python load_test.py -s ingestion -e wrk -c 1000 -d 30 -t <jwt_token>
         """,
     )
     
@@ -362,7 +1030,7 @@ examples:
         "-s", "--scenario",
         choices=["ingestion", "discovery", "both"],
         default="both",
-        help="test scenario to run (default: both)",
+        help="test scenario to run; both runs them concurrently with half the workers each (default: both)",
     )
     parser.add_argument(
         "-c", "--concurrency",
@@ -376,6 +1044,31 @@ examples:
         default=DEFAULT_DURATION_SECONDS,
         help=f"test duration in seconds (default: {DEFAULT_DURATION_SECONDS})",
     )
+    parser.add_argument(
+        "-e", "--engine",
+        choices=["asyncio", "wrk", "vegeta"],
+        default="asyncio",
+        help="load generator: built-in asyncio workers or an external wrk/vegeta binary (default: asyncio)",
+    )
+    parser.add_argument(
+        "-p", "--processes",
+        type=int,
+        default=1,
+        help="processes to split the asyncio workers across, e.g. one per core (default: 1)",
+    )
+    parser.add_argument(
+        "-r", "--rps",
+        type=float,
+        default=0,
+        help="open-model target rate in req/s with poisson arrivals; latency includes queueing "
+             "and -c bounds requests in flight (default: 0, closed loop)",
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=int,
+        default=DEFAULT_JITTER_MS,
+        help=f"max random pause after each request in ms, caps per-worker rps (default: {DEFAULT_JITTER_MS})",
+    )
     parser.add_argument(
         "-u", "--url",
         default=DEFAULT_BASE_URL,
@@ -393,6 +1086,10 @@ examples:
     )
     
     args = parser.parse_args()
+    if args.rps < 0:
+        parser.error("--rps must not be negative")
+    if args.rps and args.engine == "wrk":
+        parser.error("--rps needs an open-model engine: use --engine asyncio or vegeta (wrk is closed loop)")
     
     print("\n" + "="*60)
     print("PULSE LOAD TESTING")
@@ -401,12 +1098,20 @@ examples:
     print(f"scenario: {args.scenario}")
     print(f"concurrency: {args.concurrency}")
     print(f"duration: {args.duration}s")
+    print(f"engine: {args.engine}")
+    if args.rps:
+        print(f"target rate: {args.rps:g} req/s (open model)")
+    if args.engine == "asyncio":
+        print(f"processes: {args.processes}")
+        print(f"event loop: {'uvloop' if uvloop else 'asyncio'}")
     
-    # fetch communities for ingestion test
-    community_ids = args.community_ids
-    if args.scenario in ("ingestion", "both") and not community_ids:
-        print("\nfetching communities from api...")
-        async with aiohttp.ClientSession() as session:
+    # one session and connection pool shared by the community lookup and all
+    # scenarios, so keep-alive connections and cached dns survive between runs
+    async with create_session(args.concurrency, args.url) as session:
+        # fetch communities for ingestion test
+        community_ids = args.community_ids
+        if args.scenario in ("ingestion", "both") and not community_ids:
+            print("\nfetching communities from api...")
             communities = await fetch_communities(session, args.url, args.token)
             if not communities:
                 print("error: no communities found. create some first.")
@@ -414,62 +1119,61 @@ examples:
             community_ids = [c["id"] for c in communities]
             print(f"found {len(community_ids)} communities")
     
-    # run tests
-    if args.scenario == "ingestion":
-        stats = await run_ingestion_test(
-            args.url, args.token, args.concurrency, args.duration, community_ids
-        )
-        print_results("ingestion", stats, args.duration)
-        
-    elif args.scenario == "discovery":
-        stats = await run_discovery_test(
-            args.url, args.token, args.concurrency, args.duration
-        )
-        print_results("discovery", stats, args.duration)
-        
-    elif args.scenario == "both":
-        # run ingestion first
-        ingestion_stats = await run_ingestion_test(
-            args.url, args.token, args.concurrency, args.duration // 2, community_ids
-        )
-        print_results("ingestion", ingestion_stats, args.duration // 2)
+        # run tests
+        if args.scenario == "ingestion":
+            summary, errors = await run_scenario(
+                session, args, "ingestion", args.concurrency, args.duration, community_ids, args.rps
+            )
+            print_results("ingestion", summary, args.duration, errors)
         
-        # brief pause to let things settle
-        print("\npausing 5s before discovery test...")
-        await asyncio.sleep(5)
+        elif args.scenario == "discovery":
+            summary, errors = await run_scenario(
+                session, args, "discovery", args.concurrency, args.duration, community_ids, args.rps
+            )
+            print_results("discovery", summary, args.duration, errors)
         
-        # run discovery
-        discovery_stats = await run_discovery_test(
-            args.url, args.token, args.concurrency, args.duration // 2
-        )
-        print_results("discovery", discovery_stats, args.duration // 2)
+        elif args.scenario == "both":
+            # mixed traffic: both scenarios run concurrently on the shared pool
+            (ingestion_summary, ingestion_errors), (discovery_summary, discovery_errors) = await run_mixed(
+                session, args, community_ids
+            )
+            print_results("ingestion", ingestion_summary, args.duration, ingestion_errors)
+            print_results("discovery", discovery_summary, args.duration, discovery_errors)
         
-        # combined summary
-        print("\n" + "="*60)
-        print("COMBINED SUMMARY")
-        print("="*60)
-        print(f"\nIngestion: p95={ingestion_stats.percentile(95):.2f}ms, p99={ingestion_stats.percentile(99):.2f}ms")
-        print(f"Discovery: p95={discovery_stats.percentile(95):.2f}ms, p99={discovery_stats.percentile(99):.2f}ms")
+            # combined summary
+            print("\n" + "="*60)
+            print("COMBINED SUMMARY")
+            print("="*60)
+            print(f"\nIngestion: p95={ingestion_summary.get('p95_ms', 0.0):.2f}ms, p99={ingestion_summary.get('p99_ms', 0.0):.2f}ms")
+            print(f"Discovery: p95={discovery_summary.get('p95_ms', 0.0):.2f}ms, p99={discovery_summary.get('p99_ms', 0.0):.2f}ms")
         
-        # overall assessment
-        ingestion_p99 = ingestion_stats.percentile(99)
-        discovery_p99 = discovery_stats.percentile(99)
+            # overall assessment (reuses the single sort done for each report)
+            ingestion_p99 = ingestion_summary.get("p99_ms", 0.0)
+            discovery_p99 = discovery_summary.get("p99_ms", 0.0)
         
-        print("\n" + "-"*60)
-        if ingestion_p99 < 100 and discovery_p99 < 50:
-            print("✓ PASS: both scenarios within acceptable latency targets")
-            print(f"  - ingestion p99 < 100ms: {ingestion_p99:.2f}ms")
-            print(f"  - discovery p99 < 50ms: {discovery_p99:.2f}ms (redis serving)")
-        else:
-            print("✗ REVIEW: latency targets may not be met")
-            if ingestion_p99 >= 100:
-                print(f"  - ingestion p99 >= 100ms: {ingestion_p99:.2f}ms")
-            if discovery_p99 >= 50:
-                print(f"  - discovery p99 >= 50ms: {discovery_p99:.2f}ms")
-        print("-"*60)
+            print("\n" + "-"*60)
+            if ingestion_p99 < 100 and discovery_p99 < 50:
+                print("✓ PASS: both scenarios within acceptable latency targets")
+                print(f"  - ingestion p99 < 100ms: {ingestion_p99:.2f}ms")
+                print(f"  - discovery p99 < 50ms: {discovery_p99:.2f}ms (redis serving)")
+            else:
+                print("✗ REVIEW: latency targets may not be met")
+                if ingestion_p99 >= 100:
+                    print(f"  - ingestion p99 >= 100ms: {ingestion_p99:.2f}ms")
+                if discovery_p99 >= 50:
+                    print(f"  - discovery p99 >= 50ms: {discovery_p99:.2f}ms")
+            print("-"*60)
     
     print("\nload test complete.\n")
 
 
+def run_event_loop(coro):
+    """run a coroutine to completion, on uvloop when it is installed"""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
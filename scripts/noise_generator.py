@@ -1,14 +1,25 @@
 import argparse
+import asyncio
+import itertools
+import json
 import random
-import time
 import sys
 from typing import Optional
-import requests
+
+try:
+    import aiohttp
+except ImportError:
+    print("error: aiohttp is required. install with: pip install aiohttp")
+    sys.exit(1)
+
+# multidict ships with aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
 
 # default configuration
 DEFAULT_BASE_URL = "http://localhost:8080"
 DEFAULT_EVENTS_COUNT = 50
 DEFAULT_DELAY_MS = 100
+DEFAULT_CONCURRENCY = 10
 
 # available event types with their relative weights for random selection
 # higher weight = more likely to be selected (simulates realistic distribution)
@@ -21,17 +32,14 @@ EVENT_TYPES = [
     ("share", 5),      # rare
 ]
 
+# cumulative weights are computed once so each draw is a single C-level call
+_EVENT_NAMES = [event_type for event_type, _ in EVENT_TYPES]
+_EVENT_CUM_WEIGHTS = list(itertools.accumulate(weight for _, weight in EVENT_TYPES))
+
 
 def weighted_random_event() -> str:
     """select an event type based on realistic distribution"""
-    total = sum(w for _, w in EVENT_TYPES)
-    r = random.randint(1, total)
-    cumulative = 0
-    for event_type, weight in EVENT_TYPES:
-        cumulative += weight
-        if r <= cumulative:
-            return event_type
-    return "view"
+    return random.choices(_EVENT_NAMES, cum_weights=_EVENT_CUM_WEIGHTS)[0]
 
 
 def random_weight() -> Optional[float]:
@@ -49,19 +57,24 @@ def random_metadata() -> dict:
     return {}
 
 
-def send_event(
+def auth_headers(token: str, json_body: bool = False) -> CIMultiDictProxy:
+    """build read-only request headers once so they can be shared by every request"""
+    headers = CIMultiDict(Authorization=f"Bearer {token}")
+    if json_body:
+        headers["Content-Type"] = "application/json"
+    return CIMultiDictProxy(headers)
+
+
+async def send_event(
+    session: aiohttp.ClientSession,
     base_url: str,
-    token: str,
+    headers: CIMultiDictProxy,
     community_id: str,
     event_type: str,
     weight: Optional[float] = None,
     metadata: Optional[dict] = None,
 ) -> dict:
     url = f"{base_url}/api/v1/events"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
     payload = {
         "community_id": community_id,
         "event_type": event_type,
@@ -71,40 +84,40 @@ def send_event(
     if metadata:
         payload["metadata"] = metadata
 
-    response = requests.post(url, json=payload, headers=headers, timeout=10)
-    return {
-        "status": response.status_code,
-        "body": response.json() if response.content else {},
-    }
+    async with session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        body = await response.text()
+        return {
+            "status": response.status,
+            "body": json.loads(body) if body else {},
+        }
 
 
-def fetch_communities(base_url: str, token: str, limit: int = 20) -> list:
+async def fetch_communities(base_url: str, token: str, limit: int = 20) -> list:
     url = f"{base_url}/api/v1/communities"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
+    headers = auth_headers(token)
     params = {"limit": limit}
     
-    response = requests.get(url, headers=headers, params=params, timeout=10)
-    if response.status_code != 200:
-        print(f"failed to fetch communities: {response.status_code}")
-        return []
-    
-    data = response.json()
-    return data.get("communities", [])
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                print(f"failed to fetch communities: {response.status}")
+                return []
+            
+            data = await response.json()
+            return data.get("communities", [])
 
 
-def generate_noise(
+async def generate_noise(
     base_url: str,
     token: str,
     community_ids: list,
     count: int,
     delay_ms: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
     verbose: bool = False,
 ):
     print(f"\ngenerating {count} events across {len(community_ids)} community(ies)...")
-    print(f"   delay between events: {delay_ms}ms\n")
+    print(f"   delay between events: {delay_ms}ms, concurrency: {concurrency}\n")
     
     stats = {
         "success": 0,
@@ -113,41 +126,53 @@ def generate_noise(
         "by_community": {},
     }
     
-    for i in range(count):
+    # bounds the number of requests in flight at any time
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = auth_headers(token, json_body=True)
+    
+    async def emit(session: aiohttp.ClientSession, i: int) -> tuple:
         community_id = random.choice(community_ids)
         event_type = weighted_random_event()
         weight = random_weight()
         metadata = random_metadata()
         
-        try:
-            result = send_event(
-                base_url, token, community_id, event_type, weight, metadata
-            )
+        # pacing: event i is released i * delay after the start
+        if delay_ms > 0:
+            await asyncio.sleep(i * delay_ms / 1000)
+        
+        async with semaphore:
+            try:
+                result = await send_event(
+                    session, base_url, headers, community_id, event_type, weight, metadata
+                )
+            except Exception as e:
+                return community_id, event_type, None, e
+        return community_id, event_type, result, None
+    
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for done, future in enumerate(asyncio.as_completed([emit(session, i) for i in range(count)]), 1):
+            community_id, event_type, result, error = await future
             
-            if result["status"] == 201:
+            if error is not None:
+                stats["failed"] += 1
+                if verbose:
+                    print(f"  [{done}/{count}] error: {error}")
+            elif result["status"] == 201:
                 stats["success"] += 1
                 stats["by_type"][event_type] = stats["by_type"].get(event_type, 0) + 1
                 stats["by_community"][community_id] = stats["by_community"].get(community_id, 0) + 1
                 
                 if verbose:
-                    print(f"  [{i+1}/{count}] {event_type} -> {community_id[:8]}...")
+                    print(f"  [{done}/{count}] {event_type} -> {community_id[:8]}...")
             else:
                 stats["failed"] += 1
                 if verbose:
-                    print(f"  [{i+1}/{count}] {event_type} failed: {result['body']}")
-        
-        except Exception as e:
-            stats["failed"] += 1
-            if verbose:
-                print(f"  [{i+1}/{count}] error: {e}")
-        
-        # progress indicator
-        if not verbose and (i + 1) % 10 == 0:
-            print(f"   progress: {i+1}/{count} ({(i+1)/count*100:.0f}%)")
-        
-        # delay between events
-        if delay_ms > 0 and i < count - 1:
-            time.sleep(delay_ms / 1000)
+                    print(f"  [{done}/{count}] {event_type} failed: {result['body']}")
+            
+            # progress indicator
+            if not verbose and done % 10 == 0:
+                print(f"   progress: {done}/{count} ({done/count*100:.0f}%)")
     
     return stats
 
@@ -187,6 +212,9 @@ Examples:
 
   # Verbose mode with custom delay
   python noise_generator.py --community-id abc123 --token eyJ... --verbose --delay 50
+
+  # Burst 50000 events with 200 requests in flight and no pacing
+  python noise_generator.py --random --count 50000 --delay 0 --concurrency 200 --token eyJ...
         """,
     )
     
@@ -225,7 +253,13 @@ Examples:
         "--delay", "-d",
         type=int,
         default=DEFAULT_DELAY_MS,
-        help=f"Delay between events in ms (default: {DEFAULT_DELAY_MS})",
+        help=f"Delay between events in ms, 0 sends as fast as concurrency allows (default: {DEFAULT_DELAY_MS})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of requests in flight (default: {DEFAULT_CONCURRENCY})",
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -238,7 +272,7 @@ Examples:
     # determine target communities
     if args.random:
         print(f"fetching communities from {args.base_url}...")
-        communities = fetch_communities(args.base_url, args.token)
+        communities = asyncio.run(fetch_communities(args.base_url, args.token))
         
         if not communities:
             print("no communities found. create some first or check your token.")
@@ -250,14 +284,15 @@ Examples:
         community_ids = [args.community_id]
     
     # generate noise
-    stats = generate_noise(
+    stats = asyncio.run(generate_noise(
         base_url=args.base_url,
         token=args.token,
         community_ids=community_ids,
         count=args.count,
         delay_ms=args.delay,
+        concurrency=args.concurrency,
         verbose=args.verbose,
-    )
+    ))
     
     # print summary
     print_stats(stats)